@@ -43,73 +43,57 @@ def _get_uv_layer(bm):
     return uv_layer
 
 
-def _get_src_face_info(bm, uv_layers, only_select=False):
-    src_info = {}
-    for layer in uv_layers:
-        face_info = []
-        for face in bm.faces:
-            if not only_select or face.select:
-                info = {
-                    "index": face.index,
-                    "uvs": [l[layer].uv.copy() for l in face.loops],
-                    "pin_uvs": [l[layer].pin_uv for l in face.loops],
-                    "seams": [l.edge.seam for l in face.loops],
-                }
-                face_info.append(info)
-        if not face_info:
-            return None
-        src_info[layer.name] = face_info
-
-    return src_info
-
-
-def _paste_uv(bm, src_info, dest_info, uv_layers, strategy, flip,
-              rotate, copy_seams):
-    for slayer_name, dlayer in zip(src_info.keys(), uv_layers):
-        src_faces = src_info[slayer_name]
-        dest_faces = dest_info[dlayer.name]
-
-        for idx, dinfo in enumerate(dest_faces):
-            sinfo = None
-            if strategy == 'N_N':
-                sinfo = src_faces[idx]
-            elif strategy == 'N_M':
-                sinfo = src_faces[idx % len(src_faces)]
-
-            suv = sinfo["uvs"]
-            spuv = sinfo["pin_uvs"]
-            ss = sinfo["seams"]
-            if len(sinfo["uvs"]) != len(dinfo["uvs"]):
-                return -1
-
-            suvs_fr = [uv for uv in suv]
-            spuvs_fr = [pin_uv for pin_uv in spuv]
-            ss_fr = [s for s in ss]
-
-            # flip UVs
-            if flip is True:
-                suvs_fr.reverse()
-                spuvs_fr.reverse()
-                ss_fr.reverse()
-
-            # rotate UVs
-            for _ in range(rotate):
-                uv = suvs_fr.pop()
-                pin_uv = spuvs_fr.pop()
-                s = ss_fr.pop()
-                suvs_fr.insert(0, uv)
-                spuvs_fr.insert(0, pin_uv)
-                ss_fr.insert(0, s)
-
-            # paste UVs
-            for l, suv, spuv, ss in zip(bm.faces[dinfo["index"]].loops,
-                                        suvs_fr, spuvs_fr, ss_fr):
-                l[dlayer].uv = suv
-                l[dlayer].pin_uv = spuv
-                if copy_seams is True:
-                    l.edge.seam = ss
-
-    return 0
+def _get_src_face_info(bm, uv_layer, collect_seams=True):
+    # only the loops of selected faces are read, but finding those faces
+    # still walks every face of the mesh
+    face_info = []
+    for face in (f for f in bm.faces if f.select):
+        loops = list(face.loops)
+        info = {
+            "face": face,
+            "uvs": [tuple(l[uv_layer].uv) for l in loops],
+            "pin_uvs": [l[uv_layer].pin_uv for l in loops],
+            "seams": None,
+        }
+        if collect_seams:
+            info["seams"] = [l.edge.seam for l in loops]
+        face_info.append(info)
+
+    return face_info
+
+
+def _flip_rotate_inplace(uv_layer, face_info, flip, rotate):
+    for info in face_info:
+        uvs = info["uvs"]
+        pin_uvs = info["pin_uvs"]
+        seams = info["seams"]
+
+        # flip UVs
+        if flip is True:
+            uvs = uvs[::-1]
+            pin_uvs = pin_uvs[::-1]
+            if seams is not None:
+                seams = seams[::-1]
+
+        # rotate UVs
+        r = rotate % len(uvs)
+        if r:
+            uvs = uvs[-r:] + uvs[:-r]
+            pin_uvs = pin_uvs[-r:] + pin_uvs[:-r]
+            if seams is not None:
+                seams = seams[-r:] + seams[:-r]
+
+        # paste UVs
+        face_loops = info["face"].loops
+        for l, uv, pin_uv in zip(face_loops, uvs, pin_uvs):
+            loop_data = l[uv_layer]
+            loop_data.uv = uv
+            loop_data.pin_uv = pin_uv
+        if seams is not None:
+            for l, seam in zip(face_loops, seams):
+                l.edge.seam = seam
+
+    return len(face_info)
 
 
 @PropertyClassRegistry()
@@ -177,9 +161,11 @@ class MUV_OT_FlipRotateUV(bpy.types.Operator):
 
         face_count = 0
         for obj in objs:
+            # skip objects without selected faces before building BMesh
+            if obj.data.total_face_sel == 0:
+                continue
+
             bm = bmesh.from_edit_mesh(obj.data)
-            if common.check_version(2, 73, 0) >= 0:
-                bm.faces.ensure_lookup_table()
 
             # get UV layer
             uv_layer = _get_uv_layer(bm)
@@ -189,27 +175,31 @@ class MUV_OT_FlipRotateUV(bpy.types.Operator):
                             .format(obj.name))
                 return {'CANCELLED'}
 
-            # get selected face
-            src_info = _get_src_face_info(bm, [uv_layer], True)
-            if not src_info:
+            # identity flip/rotate does not change any UVs
+            if not self.flip and self.rotate == 0:
+                face_count += obj.data.total_face_sel
                 continue
 
-            # paste
-            ret = _paste_uv(bm, src_info, src_info, [uv_layer], 'N_N',
-                            self.flip, self.rotate, self.seams)
-            if ret:
-                self.report({'WARNING'},
-                            "Some Object {}'s faces are different size"
-                            .format(obj.name))
-                return {'CANCELLED'}
+            # get selected face
+            face_info = _get_src_face_info(bm, uv_layer, self.seams)
+            if not face_info:
+                continue
 
-            bmesh.update_edit_mesh(obj.data)
+            # flip/rotate
+            face_count += _flip_rotate_inplace(uv_layer, face_info,
+                                               self.flip, self.rotate)
+
+            # only UVs and seams are changed, so neither the triangulation
+            # nor the topology needs to be rebuilt
+            if compat.check_version(2, 80, 0) >= 0:
+                bmesh.update_edit_mesh(obj.data, loop_triangles=False,
+                                       destructive=False)
+            else:
+                bmesh.update_edit_mesh(obj.data, False, False)
             if compat.check_version(2, 80, 0) < 0:
                 if self.seams is True:
                     obj.data.show_edge_seams = True
 
-            face_count += len(src_info[list(src_info.keys())[0]])
-
         if face_count == 0:
             self.report({'WARNING'}, "No faces are selected")
             return {'CANCELLED'}
@@ -5,11 +5,16 @@ __status__ = "production"
 __version__ = "6.6"
 __date__ = "22 Apr 2022"
 
+from collections import namedtuple
+
 from .. import common
 
 
+_Entry = namedtuple("_Entry", "idname cls legacy")
+
+
 class PropertyClassRegistry:
-    class_list = []
+    class_list = {}
 
     def __init__(self, *_, **kwargs):
         self.legacy = kwargs.get('legacy', False)
@@ -20,31 +25,26 @@ class PropertyClassRegistry:
 
     @classmethod
     def add_class(cls, idname, prop_class, legacy):
-        for class_ in cls.class_list:
-            if (class_["idname"] == idname) and (class_["legacy"] == legacy):
-                raise RuntimeError("{} is already registered".format(idname))
-
-        new_op = {
-            "idname": idname,
-            "class": prop_class,
-            "legacy": legacy,
-        }
-        cls.class_list.append(new_op)
+        key = (idname, legacy)
+        if key in cls.class_list:
+            raise RuntimeError("{} is already registered".format(idname))
+
+        cls.class_list[key] = _Entry(idname, prop_class, legacy)
         common.debug_print("{} is registered.".format(idname))
 
     @classmethod
     def init_props(cls, scene):
-        for class_ in cls.class_list:
-            class_["class"].init_props(scene)
-            common.debug_print("{} is initialized.".format(class_["idname"]))
+        for class_ in cls.class_list.values():
+            class_.cls.init_props(scene)
+            common.debug_print("{} is initialized.".format(class_.idname))
 
     @classmethod
     def del_props(cls, scene):
-        for class_ in cls.class_list:
-            class_["class"].del_props(scene)
-            common.debug_print("{} is cleared.".format(class_["idname"]))
+        for class_ in cls.class_list.values():
+            class_.cls.del_props(scene)
+            common.debug_print("{} is cleared.".format(class_.idname))
 
     @classmethod
     def cleanup(cls):
-        cls.class_list = []
+        cls.class_list = {}
         common.debug_print("Cleanup registry.")
@@ -1,6 +1,7 @@
 import unittest
 
 import bpy
+import bmesh
 
 from . import common
 from . import compatibility as compat
@@ -48,6 +49,58 @@ class TestFlipRotateUV(common.TestBase):
         result = bpy.ops.uv.muv_flip_rotate_uv(flip=True, rotate=5, seams=False)
         self.assertSetEqual(result, {'FINISHED'})
 
+    def test_ok_flip_rotate_uvs(self):
+        print("[TEST] (OK) Flip/Rotate UVs")
+        obj = compat.get_active_object(bpy.context)
+        bpy.ops.mesh.uv_texture_add()
+        bpy.ops.mesh.select_all(action='SELECT')
+
+        # give every loop a distinct UV coordinate
+        bm = bmesh.from_edit_mesh(obj.data)
+        uv_layer = bm.loops.layers.uv.verify()
+        orig_uvs = []
+        i = 0
+        for f in bm.faces:
+            face_uvs = []
+            for l in f.loops:
+                l[uv_layer].uv = (i * 0.01, i * 0.02)
+                face_uvs.append((i * 0.01, i * 0.02))
+                i += 1
+            orig_uvs.append(face_uvs)
+        bmesh.update_edit_mesh(obj.data)
+
+        result = bpy.ops.uv.muv_flip_rotate_uv(flip=True, rotate=1)
+        self.assertSetEqual(result, {'FINISHED'})
+
+        bm = bmesh.from_edit_mesh(obj.data)
+        uv_layer = bm.loops.layers.uv.verify()
+        for f, face_uvs in zip(bm.faces, orig_uvs):
+            # flip reverses the loop order, rotate shifts it by one
+            expected = face_uvs[::-1]
+            expected = expected[-1:] + expected[:-1]
+            for l, uv in zip(f.loops, expected):
+                self.assertAlmostEqual(l[uv_layer].uv[0], uv[0], places=5)
+                self.assertAlmostEqual(l[uv_layer].uv[1], uv[1], places=5)
+
+    def test_ok_keep_seams(self):
+        print("[TEST] (OK) Keep seams")
+        obj = compat.get_active_object(bpy.context)
+        bpy.ops.mesh.uv_texture_add()
+        bpy.ops.mesh.select_all(action='SELECT')
+
+        bm = bmesh.from_edit_mesh(obj.data)
+        for i, e in enumerate(bm.edges):
+            e.seam = (i % 3 == 0)
+        orig_seams = [e.seam for e in bm.edges]
+        bmesh.update_edit_mesh(obj.data)
+
+        result = bpy.ops.uv.muv_flip_rotate_uv(flip=True, rotate=1,
+                                               seams=False)
+        self.assertSetEqual(result, {'FINISHED'})
+
+        bm = bmesh.from_edit_mesh(obj.data)
+        self.assertListEqual([e.seam for e in bm.edges], orig_seams)
+
     @unittest.skipIf(compat.check_version(2, 80, 0) < 0,
                      "Not supported in <2.80")
     def test_ok_multiple_objects(self):